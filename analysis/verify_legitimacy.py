@@ -7,31 +7,108 @@ and semantically correct. Requires the Rust server to be running locally on:
     http://127.0.0.1:3030
 """
 
+import asyncio
 import json
-import time
 from typing import List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from websockets import client as ws_client
+from websockets.exceptions import WebSocketException
 
 SERVER_URL = "http://127.0.0.1:3030/action"
+WS_URL = "ws://127.0.0.1:3030/ws"
+WS_TIMEOUT = 5.0
+
+# One pooled keep-alive connection for the whole run instead of a fresh
+# TCP handshake per action.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.headers.update({"Connection": "keep-alive"})
 
 GREEN = "\033[92m"
 RED = "\033[91m"
 CYAN = "\033[96m"
 RESET = "\033[0m"
 
+# Cleared after the first WebSocket failure or timeout, so a server without
+# inbound /ws actions costs one WS_TIMEOUT per run rather than one per batch.
+_ws_available = True
+
+
+class ActionError(Exception):
+    """The server rejected an action sent over the WebSocket."""
+
 
 def send_action(action: str) -> dict:
     """Send an action string to the server and return the JSON response."""
     payload = {"action_string": action}
-    response = requests.post(SERVER_URL, json=payload, timeout=5)
+    response = SESSION.post(SERVER_URL, json=payload, timeout=5)
     response.raise_for_status()
     return response.json()
 
 
+def reset_action(tag: str) -> str:
+    """Build a hand reset delimiter action string."""
+    return f"-- starting hand #{tag} --"
+
+
 def reset_hand(tag: str = "verification") -> dict:
     """Send a hand reset delimiter."""
-    return send_action(f"-- starting hand #{tag} --")
+    return send_action(reset_action(tag))
+
+
+async def send_actions_ws(actions: List[str]) -> List[dict]:
+    """
+    Pipeline actions over one WebSocket and collect each action's reply.
+
+    The server answers every action frame, in order, with either
+    {"reply": update} or {"error": message}. Plain broadcast updates (from
+    this or any other client) are skipped, so they can't be mistaken for
+    this batch's responses.
+    """
+    responses: List[dict] = []
+    async with ws_client.connect(WS_URL, ping_interval=None) as websocket:
+        for action in actions:
+            await websocket.send(json.dumps({"action_string": action}))
+        async for message in websocket:
+            frame = json.loads(message)
+            if "error" in frame:
+                raise ActionError(f"{actions[len(responses)]!r}: {frame['error']}")
+            if "reply" not in frame:
+                continue
+            responses.append(frame["reply"])
+            if len(responses) == len(actions):
+                break
+    return responses
+
+
+async def send_actions(actions: List[str]) -> List[dict]:
+    """
+    Send a batch of actions in order and return their responses.
+
+    Uses the WebSocket pipeline when the server accepts inbound actions and
+    falls back to one HTTP POST per action otherwise. Batches should start
+    with a reset so a fallback replay starts from a clean hand. An action the
+    server rejects raises ActionError right away; it is not replayed. Once
+    the WebSocket has failed, later batches go straight to HTTP.
+    """
+    global _ws_available
+    if _ws_available:
+        try:
+            return await asyncio.wait_for(send_actions_ws(actions), WS_TIMEOUT)
+        except (OSError, asyncio.TimeoutError, WebSocketException):
+            _ws_available = False
+    return [send_action(action) for action in actions]
+
+
+def metrics(resp: dict) -> Tuple[int, float]:
+    """Extract (writhe, burau trace magnitude) from a fingerprint update."""
+    global_metrics = resp.get("global")
+    if global_metrics is None:
+        # Backward compatibility: old flat format
+        return resp["writhe"], resp["burau_trace_magnitude"]
+    return global_metrics["writhe"], global_metrics["burau"]
 
 
 def pretty_result(name: str, passed: bool, details: str) -> None:
@@ -42,7 +119,7 @@ def pretty_result(name: str, passed: bool, details: str) -> None:
     print("-" * 60)
 
 
-def determinism_check() -> Tuple[bool, str]:
+async def determinism_check() -> Tuple[bool, str]:
     sequence = [
         "Seat 1 bets 10",
         "Seat 2 calls 10",
@@ -53,12 +130,8 @@ def determinism_check() -> Tuple[bool, str]:
 
     traces: List[List[float]] = []
     for run in range(2):
-        reset_hand(f"determinism_{run+1}")
-        run_trace = []
-        for action in sequence:
-            resp = send_action(action)
-            run_trace.append(resp["burau_trace_magnitude"])
-        traces.append(run_trace)
+        responses = await send_actions([reset_action(f"determinism_{run+1}"), *sequence])
+        traces.append([metrics(resp)[1] for resp in responses[1:]])
 
     trace_a, trace_b = traces
     passed = trace_a == trace_b
@@ -70,14 +143,15 @@ def determinism_check() -> Tuple[bool, str]:
     return passed, details
 
 
-def fold_semantics_check() -> Tuple[bool, str]:
-    reset_hand("fold_semantics")
+async def fold_semantics_check() -> Tuple[bool, str]:
+    responses = await send_actions(
+        [reset_action("fold_semantics")] + [f"Seat {seat} folds" for seat in [1, 2, 3]]
+    )
     prev_writhe = 0
     monotonic = True
     writhe_history = []
-    for seat in [1, 2, 3]:
-        resp = send_action(f"Seat {seat} folds")
-        writhe = resp["writhe"]
+    for resp in responses[1:]:
+        writhe = metrics(resp)[0]
         writhe_history.append(writhe)
         if writhe > prev_writhe:
             monotonic = False
@@ -87,8 +161,7 @@ def fold_semantics_check() -> Tuple[bool, str]:
     return monotonic, details
 
 
-def reset_state_check() -> Tuple[bool, str]:
-    reset_hand("reset_state")
+async def reset_state_check() -> Tuple[bool, str]:
     complex_actions = [
         "Seat 1 bets 50",
         "Seat 2 raises 100",
@@ -96,19 +169,18 @@ def reset_state_check() -> Tuple[bool, str]:
         "Seat 1 raises 200",
         "Seat 2 calls 200",
     ]
-    last_response = None
-    for action in complex_actions:
-        last_response = send_action(action)
+    responses = await send_actions(
+        [reset_action("reset_state"), *complex_actions, reset_action("reset_check")]
+    )
 
-    if not last_response:
+    if len(responses) < len(complex_actions) + 2:
         return False, "No responses recorded for complex sequence."
 
-    burau_before_reset = last_response["burau_trace_magnitude"]
+    last_response = responses[-2]
+    reset_resp = responses[-1]
 
-    reset_resp = reset_hand("reset_check")
-
-    writhe_after_reset = reset_resp["writhe"]
-    burau_after_reset = reset_resp["burau_trace_magnitude"]
+    burau_before_reset = metrics(last_response)[1]
+    writhe_after_reset, burau_after_reset = metrics(reset_resp)
 
     passed = (
         burau_before_reset > 10.0
@@ -124,19 +196,20 @@ def reset_state_check() -> Tuple[bool, str]:
     return passed, details
 
 
-def main():
-    tests = [
-        ("Determinism Check", determinism_check),
-        ("Fold Semantics Check", fold_semantics_check),
-        ("Reset State Check", reset_state_check),
-    ]
-
-    print(f"{CYAN}Running Braid Engine Legitimacy Verification...{RESET}\n")
+async def run_checks(tests) -> bool:
+    """
+    Run the checks in order on a single event loop.
 
+    The checks stay sequential: they all drive the server's one shared
+    fingerprint state, so interleaving them would corrupt each other's hands.
+    """
     all_passed = True
     for name, func in tests:
         try:
-            passed, details = func()
+            passed, details = await func()
+        except ActionError as exc:
+            passed = False
+            details = f"Server rejected action {exc}"
         except requests.RequestException as exc:
             passed = False
             details = f"HTTP error: {exc}\nIs the server running at {SERVER_URL}?"
@@ -146,7 +219,20 @@ def main():
 
         pretty_result(name, passed, details)
         all_passed = all_passed and passed
-        time.sleep(0.5)
+
+    return all_passed
+
+
+def main():
+    tests = [
+        ("Determinism Check", determinism_check),
+        ("Fold Semantics Check", fold_semantics_check),
+        ("Reset State Check", reset_state_check),
+    ]
+
+    print(f"{CYAN}Running Braid Engine Legitimacy Verification...{RESET}\n")
+
+    all_passed = asyncio.run(run_checks(tests))
 
     if all_passed:
         print(f"{GREEN}All legitimacy tests passed!{RESET}")
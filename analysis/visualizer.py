@@ -9,14 +9,12 @@ Supports two modes:
 Designed with a cyberpunk/hacker aesthetic: dark background, neon lines.
 """
 
-import json
 import sys
 import argparse
-import queue
-import threading
 import asyncio
 import re
-import pandas as pd
+import orjson
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import matplotlib.patches as mpatches
@@ -28,11 +26,14 @@ BURAU_COLOR = '#00ffff'   # Cyan
 ACTION_COLOR = '#ff00ff'  # Magenta for annotations
 
 # Global data storage for real-time mode
-data_queue = queue.Queue()
-data_lock = threading.Lock()
-history_buffer = []  # List of full JSON objects
+# The WebSocket consumer and the plot share the Qt thread (via qasync), so no locks
 view_mode = 0  # 0 = Global, 1-10 = Seat ID
 player_registry = {}  # Maps Seat ID (str) -> Player Name (str) - Persistent across frames
+_roster_dirty = True  # Set when player_registry changes; roster HUD is rebuilt only then
+_last_limits = None  # (xlim, writhe ylim, burau ylim) last applied in real-time mode
+_view_dirty = False  # Set by hotkeys so the next frame re-slices even without new data
+_idle_ticks = 0  # Consecutive animation frames that drained no data
+_data_dirty = False  # Set by websocket_consumer when history_buffer gained entries
 
 # Plot objects (initialized in setup_plot)
 fig = None
@@ -41,16 +42,210 @@ ax2 = None
 writhe_line = None
 burau_line = None
 title_text = None
+action_text = None  # Latest action, drawn inside ax1 so it can be blitted
 roster_text = None  # Player roster HUD
+ani = None  # FuncAnimation driving real-time mode (initialized in main)
 
 # Configuration
 WINDOW_SIZE = 50  # Show last N steps in auto-scroll mode
 AUTO_SCROLL = True  # Enable auto-scroll when data exceeds window
+FRAME_INTERVAL_MS = 100  # Animation interval while data is flowing
+IDLE_INTERVAL_MS = 500  # Animation interval once the stream goes quiet
+IDLE_TICKS = 20  # Consecutive empty frames before slowing down
+MAX_ANNOTATIONS = 60  # Cap on action labels drawn by the static plot
+HISTORY_CAPACITY = 4096  # Max entries kept in real-time mode (oldest half dropped when full)
+X_HEADROOM = WINDOW_SIZE // 2  # Empty steps ahead of the head; x-limits jump by this much
+WRITHE_HEADROOM = 2  # Writhe units of slack above/below the data
+BURAU_HEADROOM = 0.25  # Burau slack as a fraction of its range (at least 0.5)
+
+
+class HistoryBuffer:
+    """
+    Struct-of-arrays history of fingerprint updates for real-time mode.
+
+    Row 0 of the metric arrays holds global metrics; every seat seen on the
+    wire gets its own row (server seat IDs are assigned sequentially, so they
+    can exceed 10). Windows are returned as array views, so redraws slice
+    contiguous memory instead of walking a list of dicts.
+
+    Memory is bounded: when the arrays fill up, the oldest half is discarded
+    in one block copy, so appends stay amortized O(1) on long sessions.
+    """
+
+    def __init__(self, capacity=HISTORY_CAPACITY):
+        self.n = 0
+        self.last_action = 'Waiting for data...'
+        self.steps = np.empty(capacity, dtype=np.int64)
+        self.writhe = np.zeros((1, capacity), dtype=np.int32)
+        self.burau = np.zeros((1, capacity), dtype=np.float32)
+        self.seat_rows = {}  # Maps Seat ID (str) -> row index in writhe/burau
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        """Forget all entries (arrays and seat rows are reused)"""
+        self.n = 0
+        self.last_action = 'Waiting for data...'
+
+    def last_step(self):
+        return int(self.steps[self.n - 1])
+
+    def append(self, step, action, writhe, burau, players):
+        """Append one projected update (see project_update)"""
+        if self.n == self.steps.shape[0]:
+            self._compact()
+        i = self.n
+        self.steps[i] = step if step is not None else 0
+        self.writhe[0, i] = writhe
+        self.burau[0, i] = burau
+        
+        # Player not in this update (folded/not present): 0
+        self.writhe[1:, i] = 0
+        self.burau[1:, i] = 0.0
+        for seat_str, player_data in players.items():
+            if not isinstance(player_data, dict) or not player_data:
+                continue
+            row = self.seat_rows.get(seat_str)
+            if row is None:
+                row = self._add_seat_row(seat_str)
+            self.writhe[row, i] = player_data.get('writhe', 0)
+            self.burau[row, i] = player_data.get('complexity', 0.0)
+        
+        self.last_action = action
+        self.n += 1
+
+    def window(self, view_mode, size):
+        """Return (steps, writhe, burau) views over the last `size` entries"""
+        start = max(0, self.n - size)
+        steps = self.steps[start:self.n]
+        row = 0 if view_mode == 0 else self.seat_rows.get(str(view_mode))
+        if row is None:
+            # Seat never seen: flat zero line
+            return (steps, np.zeros(len(steps), dtype=np.int32),
+                    np.zeros(len(steps), dtype=np.float32))
+        return steps, self.writhe[row, start:self.n], self.burau[row, start:self.n]
+
+    def _compact(self):
+        keep = self.steps.shape[0] // 2
+        start = self.n - keep
+        self.steps[:keep] = self.steps[start:self.n]
+        self.writhe[:, :keep] = self.writhe[:, start:self.n]
+        self.burau[:, :keep] = self.burau[:, start:self.n]
+        self.n = keep
+
+    def _add_seat_row(self, seat_str):
+        row = self.writhe.shape[0]
+        self.writhe = self._resized(self.writhe, row + 1, self.steps.shape[0])
+        self.burau = self._resized(self.burau, row + 1, self.steps.shape[0])
+        self.seat_rows[seat_str] = row
+        return row
+
+    @staticmethod
+    def _resized(arr, rows, cols):
+        out = np.zeros((rows, cols), dtype=arr.dtype)
+        out[:arr.shape[0], :arr.shape[1]] = arr
+        return out
+
+
+history_buffer = HistoryBuffer()
+
+
+def project_update(data):
+    """
+    Reduce a fingerprint update dict to the fields the plot uses.
+
+    Returns (step, action, global writhe, global burau, players); step is None
+    when the update carries no step.
+    """
+    global_metrics = data.get('global')
+    if global_metrics:
+        writhe = global_metrics.get('writhe', 0)
+        burau = global_metrics.get('burau', 0.0)
+    else:
+        # Backward compatibility: old format
+        writhe = data.get('writhe', 0)
+        burau = data.get('burau_trace_magnitude', 0.0)
+    return data.get('step'), data.get('action', ''), writhe, burau, data.get('players') or {}
+
+# Seat tag regexes: matches [S1], [S10], [S99], etc.
+_SEAT_TAG_RE = re.compile(r'\[S(\d+)\]')
+_SEAT_TAG_STRIP_RE = re.compile(r'\[S\d+\]\s*')
+_name_cache = {}  # Maps raw player name -> (seat_number or None, clean_name)
+
+
+def parse_player_name(player_name):
+    """
+    Split a raw player name into its [S#] seat number and display name.
+
+    Format: "[S9] Barmom @ gmuSM0e3Nz" -> (9, "Barmom"). Results are cached
+    by raw name since the roster re-parses the same names every frame.
+    """
+    cached = _name_cache.get(player_name)
+    if cached is not None:
+        return cached
+    
+    # Extract seat number from [S#] tag (search anywhere in string)
+    seat_number = None
+    if '[S' in player_name:
+        match = _SEAT_TAG_RE.search(player_name)
+        if match:
+            seat_number = int(match.group(1))
+    
+    # Clean the name: Remove [S#] tag and @ ID part for display
+    clean_name = _SEAT_TAG_STRIP_RE.sub('', player_name)
+    if ' @ ' in clean_name:
+        clean_name = clean_name.split(' @ ')[0].strip()
+    
+    _name_cache[player_name] = (seat_number, clean_name)
+    return seat_number, clean_name
+
+
+def build_roster_text(registry):
+    """Build the player roster HUD text from a seat -> name registry, sorted by [S#] tag"""
+    if not registry:
+        return 'Waiting for players...'
+    
+    # Build roster string sorted by [S#] tag
+    roster_lines = ['[G] GLOBAL VIEW', '']
+    
+    # Create list of (seat_number, seat_str, clean_name) tuples
+    roster_entries = []
+    for seat_str, player_name in registry.items():
+        if not isinstance(player_name, str):
+            continue
+        
+        # Extract seat number from [S#] tag (cached per raw name)
+        seat_number, clean_name = parse_player_name(player_name)
+        
+        # If no tag found, skip this entry
+        if seat_number is None:
+            continue
+        
+        roster_entries.append((seat_number, seat_str, clean_name))
+    
+    # Sort by seat number (from [S#] tag)
+    roster_entries.sort(key=lambda x: x[0])
+    
+    # Build roster entries with hotkey labels
+    for seat_number, seat_str, clean_name in roster_entries:
+        # Determine hotkey label: [0] for Seat 10, [1-9] for Seats 1-9
+        if seat_number == 10:
+            label = '[0]'
+        elif 1 <= seat_number <= 9:
+            label = f'[{seat_number}]'
+        else:
+            label = '[?]'  # Fallback for unexpected seat numbers
+        
+        # Display format: [hotkey] CleanName (Seat N)
+        roster_lines.append(f'{label} {clean_name} (Seat {seat_number})')
+    
+    return '\n'.join(roster_lines)
 
 
 def on_key_press(event):
     """Handle keyboard hotkeys to switch view modes using static [S#] tags"""
-    global view_mode, title_text, player_registry
+    global view_mode, title_text, player_registry, _view_dirty
     
     key = event.key
     # Map '`' (backtick) or 'g' to Global View
@@ -79,12 +274,13 @@ def on_key_press(event):
             title_text.set_text(f'WATCHING: SEAT {found_seat} ({player_name})')
             print(f"Switched to SEAT {found_seat} ({player_name}) view", file=sys.stderr)
     # Trigger plot refresh by updating the figure
+    _view_dirty = True
     fig.canvas.draw_idle()
 
 
 def setup_plot():
     """Initialize the matplotlib plot with dark theme"""
-    global fig, ax1, ax2, writhe_line, burau_line, title_text, roster_text
+    global fig, ax1, ax2, writhe_line, burau_line, title_text, action_text, roster_text
     
     plt.style.use('dark_background')
     fig, ax1 = plt.subplots(figsize=(14, 8))
@@ -114,6 +310,11 @@ def setup_plot():
                           label='Burau Trace Magnitude', alpha=0.9,
                           marker='o', markersize=4)
     
+    # Latest action (live mode); inside the axes so blitting can redraw it
+    action_text = ax1.text(0.99, 0.98, '', transform=ax1.transAxes,
+                           fontsize=11, color=ACTION_COLOR, family='monospace',
+                           horizontalalignment='right', verticalalignment='top')
+    
     # Title
     title_text = fig.suptitle('WATCHING: GLOBAL', 
                               fontsize=16, fontweight='bold',
@@ -149,122 +350,124 @@ def setup_plot():
 
 
 async def websocket_consumer(ws_url):
-    """Async function to consume WebSocket messages and put them in queue"""
+    """Async function to consume WebSocket messages straight into history_buffer"""
+    global _data_dirty
     try:
         # Disable ping_interval to prevent keepalive timeout errors
         # This is necessary for long idle periods (e.g., spectating mode)
-        async with ws_client.connect(ws_url, ping_interval=None) as websocket:
+        # Read-only spectator: larger frame/read buffers for bursty hands, and no
+        # permessage-deflate since the payloads are small JSON
+        async with ws_client.connect(ws_url, ping_interval=None,
+                                     max_size=4 * 1024 * 1024,
+                                     read_limit=2**18, write_limit=2**18,
+                                     compression=None) as websocket:
             print(f"Connected to {ws_url}", file=sys.stderr)
             async for message in websocket:
                 try:
-                    data = json.loads(message)
-                    data_queue.put(data)
-                except json.JSONDecodeError as e:
+                    update = project_update(orjson.loads(message))
+                except orjson.JSONDecodeError as e:
                     print(f"Warning: Invalid JSON received: {e}", file=sys.stderr)
                     continue
+                ingest_update(update)
+                _data_dirty = True
     except Exception as e:
         print(f"WebSocket error: {e}", file=sys.stderr)
-        # Put a sentinel value to signal end
-        data_queue.put(None)
 
 
-def websocket_thread(ws_url):
-    """Thread wrapper for WebSocket connection"""
-    asyncio.set_event_loop(asyncio.new_event_loop())
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(websocket_consumer(ws_url))
+def ingest_update(update):
+    """
+    Fold one projected update (see project_update) into history_buffer and
+    player_registry.
+
+    Kept free of plotting so the per-message work stays small; the plot picks
+    the new entry up on its next animation frame.
+    """
+    global _roster_dirty
+    
+    step, action, writhe, burau, players = update
+    
+    # Reset Logic: If step drops (reset), clear history_buffer
+    # CRITICAL: Do NOT clear player_registry on reset - names persist across hands
+    # player_registry is NEVER cleared, ensuring roster stability
+    if history_buffer.n > 0 and step is not None:
+        if step < history_buffer.last_step():
+            history_buffer.clear()
+            # player_registry remains intact - DO NOT CLEAR
+            print("--- HAND RESET ---", file=sys.stderr)
+    
+    # Update Persistent Player Registry
+    # Merge incoming player data into registry (always overwrite to catch name updates)
+    # This ensures player names update when [S#] tags appear or players change seats
+    # Expected format: player_data['name'] = "[S9] Barmom @ gmuSM0e3Nz" or similar
+    if players:
+        for seat_str, player_data in players.items():
+            if isinstance(player_data, dict) and 'name' in player_data:
+                # Overwrite on change to catch name updates (including [S#] tag additions)
+                if player_registry.get(seat_str) != player_data['name']:
+                    player_registry[seat_str] = player_data['name']
+                    _roster_dirty = True
+    
+    history_buffer.append(step, action, writhe, burau, players)
+
+
+def set_frame_interval(anim, interval):
+    """
+    Change a running animation's frame interval (ms).
+
+    The public event_source.interval takes effect right away, but
+    TimedAnimation._step copies its private _interval back onto the timer
+    after every frame, so both are set to keep the new value from being undone.
+    _interval is private, so it is only touched while it still exists.
+    """
+    anim.event_source.interval = interval
+    if hasattr(anim, '_interval'):
+        anim._interval = interval
 
 
 def update_plot(frame):
-    """Animation callback to update plot from queue"""
-    global history_buffer, view_mode, player_registry
+    """
+    Animation callback to redraw from history_buffer.
+
+    Runs with blit=True, so it always returns the line artists and the action
+    label. Axis limits move in coarse steps (X_HEADROOM steps ahead of the
+    head, fixed y headroom that only grows on overflow), so most data frames
+    only repaint those artists. When limits, the title or the roster do
+    change, the figure is fully redrawn once and the blit backgrounds are
+    re-captured.
+    """
+    global view_mode, _roster_dirty, _last_limits, _view_dirty, _idle_ticks, _data_dirty
+    
+    artists = (writhe_line, burau_line, action_text)
+    
+    # websocket_consumer has already folded new frames into history_buffer
+    updated = _data_dirty
+    _data_dirty = False
+    
+    # Adaptive frame rate: back off while idle, snap back on new data or hotkeys
+    if updated or _view_dirty:
+        _idle_ticks = 0
+    else:
+        _idle_ticks += 1
+    interval = IDLE_INTERVAL_MS if _idle_ticks > IDLE_TICKS else FRAME_INTERVAL_MS
+    if ani is not None and ani.event_source.interval != interval:
+        set_frame_interval(ani, interval)
     
-    # Ingest: Pull from data_queue and append to history_buffer
-    updated = False
-    while True:
-        try:
-            data = data_queue.get_nowait()
-            if data is None:  # Sentinel value
-                return
-            
-            with data_lock:
-                # Reset Logic: If step drops (reset), clear history_buffer
-                # CRITICAL: Do NOT clear player_registry on reset - names persist across hands
-                # player_registry is NEVER cleared, ensuring roster stability
-                if len(history_buffer) > 0 and 'step' in data:
-                    last_step = history_buffer[-1].get('step', 0)
-                    if data['step'] < last_step:
-                        history_buffer = []
-                        # player_registry remains intact - DO NOT CLEAR
-                        print("--- HAND RESET ---", file=sys.stderr)
-                
-                # Update Persistent Player Registry
-                # Merge incoming player data into registry (always overwrite to catch name updates)
-                # This ensures player names update when [S#] tags appear or players change seats
-                # Expected format: player_data['name'] = "[S9] Barmom @ gmuSM0e3Nz" or similar
-                players = data.get('players', {})
-                if players:
-                    for seat_str, player_data in players.items():
-                        if isinstance(player_data, dict) and 'name' in player_data:
-                            # Always overwrite to catch name updates (including [S#] tag additions)
-                            player_registry[seat_str] = player_data['name']
-                
-                history_buffer.append(data)
-                updated = True
-        except queue.Empty:
-            break
-    
-    if not updated and len(history_buffer) == 0:
-        return  # No data yet
-    
-    # Reconstruct Arrays: Iterate through history_buffer based on view_mode
-    with data_lock:
-        steps = []
-        writhe = []
-        burau = []
-        current_action = 'Waiting for data...'
-        
-        for item in history_buffer:
-            step = item.get('step', 0)
-            action = item.get('action', '')
-            
-            if view_mode == 0:
-                # Global view: Use global metrics
-                global_metrics = item.get('global', {})
-                if not global_metrics:
-                    # Backward compatibility: old format
-                    writhe_val = item.get('writhe', 0)
-                    burau_val = item.get('burau_trace_magnitude', 0.0)
-                else:
-                    writhe_val = global_metrics.get('writhe', 0)
-                    burau_val = global_metrics.get('burau', 0.0)
-            else:
-                # Seat view: Look up player in players map (supports seats 1-10)
-                players = item.get('players', {})
-                seat_str = str(view_mode)
-                player_data = players.get(seat_str, {})
-                
-                if player_data:
-                    writhe_val = player_data.get('writhe', 0)
-                    burau_val = player_data.get('complexity', 0.0)
-                else:
-                    # Player not in hand (folded/not present): Use 0
-                    writhe_val = 0
-                    burau_val = 0.0
-            
-            steps.append(step)
-            writhe.append(writhe_val)
-            burau.append(burau_val)
-            current_action = action  # Keep last action
+    if not updated and not _view_dirty:
+        return artists  # Nothing new: keep the cached artists
+    # A view switch rescales from scratch instead of only growing the limits
+    rescale = _view_dirty or _last_limits is None
+    _view_dirty = False
     
-    if len(steps) == 0:
-        return
+    if len(history_buffer) == 0:
+        return artists  # No data yet
     
-    # Auto-scroll: show last WINDOW_SIZE steps
-    if AUTO_SCROLL and len(steps) > WINDOW_SIZE:
-        steps = steps[-WINDOW_SIZE:]
-        writhe = writhe[-WINDOW_SIZE:]
-        burau = burau[-WINDOW_SIZE:]
+    # Slice the plotted window straight out of the history arrays
+    window = WINDOW_SIZE if AUTO_SCROLL else len(history_buffer)
+    steps, writhe, burau = history_buffer.window(view_mode, window)
+    current_action = history_buffer.last_action
+    
+    if len(steps) == 0:
+        return artists
     
     # Update writhe line (step function)
     writhe_line.set_data(steps, writhe)
@@ -272,106 +475,95 @@ def update_plot(frame):
     # Update burau line
     burau_line.set_data(steps, burau)
     
-    # Dynamic scaling (auto-rescale when switching views)
-    if len(steps) > 0:
-        ax1.set_xlim([min(steps) - 0.5, max(steps) + 0.5])
-        if len(writhe) > 0:
-            writhe_min = min(writhe)
-            writhe_max = max(writhe)
-            # Add padding to prevent flat lines from being invisible
-            if writhe_max == writhe_min:
-                ax1.set_ylim([writhe_min - 1, writhe_max + 1])
-            else:
-                ax1.set_ylim([writhe_min - 1, writhe_max + 1])
-        
-        if len(burau) > 0:
-            burau_min = min(burau)
-            burau_max = max(burau)
-            # Add padding to prevent flat lines from being invisible
-            if burau_max == burau_min:
-                margin = 0.1
-            else:
-                margin = (burau_max - burau_min) * 0.1
-            ax2.set_ylim([burau_min - margin, burau_max + margin])
+    action_text.set_text(current_action)
+    
+    # Dynamic scaling: keep the current limits while the data fits inside them
+    # Ranges use NumPy reductions; steps aren't assumed monotonic because a
+    # step-less frame is stored as step 0 without triggering a reset
+    step_min = float(steps.min())
+    step_max = float(steps.max())
+    writhe_min = int(writhe.min())
+    writhe_max = int(writhe.max())
+    burau_min = float(burau.min())
+    burau_max = float(burau.max())
     
-    # Update title with current view mode and action
+    if rescale:
+        x_lim = writhe_lim = burau_lim = None
+    else:
+        x_lim, writhe_lim, burau_lim = _last_limits
+    
+    # X: when the head passes the right edge (or a reset jumps back), jump so
+    # the window starts at the oldest plotted step with X_HEADROOM to spare
+    if x_lim is None or step_max + 0.5 > x_lim[1] or step_min - 0.5 < x_lim[0]:
+        x_lo = step_min - 0.5
+        x_hi = max(x_lo + WINDOW_SIZE + X_HEADROOM, step_max + 0.5 + X_HEADROOM)
+        x_lim = (x_lo, x_hi)
+    
+    # Y: fixed headroom, re-fitted only when the data gets within one writhe
+    # unit / 5% of the burau range of an edge (so lines never sit on the spines)
+    if (writhe_lim is None or writhe_min - 1 < writhe_lim[0]
+            or writhe_max + 1 > writhe_lim[1]):
+        writhe_lim = (writhe_min - WRITHE_HEADROOM, writhe_max + WRITHE_HEADROOM)
+    if burau_lim is not None:
+        edge = (burau_lim[1] - burau_lim[0]) * 0.05
+    if (burau_lim is None or burau_min - edge < burau_lim[0]
+            or burau_max + edge > burau_lim[1]):
+        margin = max(0.5, (burau_max - burau_min) * BURAU_HEADROOM)
+        burau_lim = (burau_min - margin, burau_max + margin)
+    
+    # Only touch the axes when the limits actually moved
+    full_redraw = False
+    limits = (x_lim, writhe_lim, burau_lim)
+    if limits != _last_limits:
+        ax1.set_xlim(x_lim)
+        ax1.set_ylim(writhe_lim)
+        ax2.set_ylim(burau_lim)
+        _last_limits = limits
+        full_redraw = True
+    
+    # Update title with current view mode (the action is in action_text)
     if view_mode == 0:
-        title_text.set_text(f'WATCHING: GLOBAL - {current_action}')
+        title = 'WATCHING: GLOBAL'
     else:
         # Get player name from persistent registry
         seat_str = str(view_mode)
         player_name = player_registry.get(seat_str, f"Seat {view_mode}")
-        title_text.set_text(f'WATCHING: SEAT {view_mode} ({player_name}) - {current_action}')
+        title = f'WATCHING: SEAT {view_mode} ({player_name})'
+    if title != title_text.get_text():
+        title_text.set_text(title)
+        full_redraw = True
     
     # Update Player Roster HUD (use persistent registry, sorted by [S#] tag)
-    if player_registry:
-        # Build roster string sorted by [S#] tag
-        roster_lines = ['[G] GLOBAL VIEW', '']
-        
-        # Create list of (seat_number, seat_str, player_name) tuples
-        roster_entries = []
-        for seat_str, player_name in player_registry.items():
-            if not isinstance(player_name, str):
-                continue
-            
-            # Extract seat number from [S#] tag in name (search anywhere in string)
-            # Regex handles single digits (1-9) and double digits (10) correctly
-            seat_number = None
-            if '[S' in player_name:
-                # Robust regex: matches [S1], [S10], [S99], etc.
-                match = re.search(r'\[S(\d+)\]', player_name)
-                if match:
-                    seat_number = int(match.group(1))
-            
-            # If no tag found, skip this entry
-            if seat_number is None:
-                continue
-            
-            roster_entries.append((seat_number, seat_str, player_name))
-        
-        # Sort by seat number (from [S#] tag)
-        roster_entries.sort(key=lambda x: x[0])
-        
-        # Build roster entries with hotkey labels
-        for seat_number, seat_str, player_name in roster_entries:
-            # Determine hotkey label: [0] for Seat 10, [1-9] for Seats 1-9
-            if seat_number == 10:
-                label = '[0]'
-            elif 1 <= seat_number <= 9:
-                label = f'[{seat_number}]'
-            else:
-                label = '[?]'  # Fallback for unexpected seat numbers
-            
-            # Clean the name: Remove [S#] tag and @ ID part for display
-            # Format: "[S9] Barmom @ gmuSM0e3Nz" -> "Barmom"
-            clean_name = player_name
-            # Remove [S#] tag if present
-            clean_name = re.sub(r'\[S\d+\]\s*', '', clean_name)
-            # Remove @ ID part if present
-            if ' @ ' in clean_name:
-                clean_name = clean_name.split(' @ ')[0].strip()
-            
-            # Display format: [hotkey] CleanName (Seat N)
-            roster_lines.append(f'{label} {clean_name} (Seat {seat_number})')
-        
-        roster_text.set_text('\n'.join(roster_lines))
-    else:
-        roster_text.set_text('Waiting for players...')
+    # Only rebuilt when player_registry actually changed
+    if _roster_dirty:
+        roster_text.set_text(build_roster_text(player_registry))
+        _roster_dirty = False
+        full_redraw = True
+    
+    if full_redraw:
+        # Blitting only repaints the artists above; ticks, title and roster need a real draw
+        if ani is not None and not hasattr(ani, '_blit_cache'):
+            # _blit_cache is private: if a matplotlib release drops it, fall
+            # back to a plain redraw rather than failing inside the callback
+            fig.canvas.draw_idle()
+        else:
+            fig.canvas.draw()
+            if ani is not None:
+                # ax1 and ax2 share a bbox: drop both cached backgrounds so neither
+                # restores a pre-redraw copy (e.g. stale gridlines) on the next frame
+                ani._blit_cache.clear()
     
-    return writhe_line, burau_line, title_text
+    return artists
 
 
 def plot_static(data):
     """Plot all data at once (STDIN mode)"""
-    global history_buffer, view_mode, player_registry
+    global view_mode, player_registry
     
     if not data:
         print("Error: No valid JSON data received", file=sys.stderr)
         sys.exit(1)
     
-    # Store in history_buffer for consistency
-    history_buffer = data
-    
     # Populate player registry from all data points
     player_registry.clear()
     for item in data:
@@ -381,45 +573,48 @@ def plot_static(data):
                 if isinstance(player_data, dict) and 'name' in player_data:
                     player_registry[seat_str] = player_data['name']
     
-    # Convert to DataFrame for easier processing
-    df = pd.DataFrame(data)
-    df = df.sort_values('step').reset_index(drop=True)
-    
-    # Setup plot
-    setup_plot()
-    
-    # Extract data based on view_mode (default: Global)
-    if view_mode == 0:
-        # Global view
-        if 'global' in df.columns:
-            # New format
-            writhe_data = df['global'].apply(lambda x: x.get('writhe', 0) if isinstance(x, dict) else 0)
-            burau_data = df['global'].apply(lambda x: x.get('burau', 0.0) if isinstance(x, dict) else 0.0)
-        else:
-            # Backward compatibility: old format
-            writhe_data = df.get('writhe', pd.Series([0] * len(df)))
-            burau_data = df.get('burau_trace_magnitude', pd.Series([0.0] * len(df)))
-    else:
-        # Seat view (supports seats 1-10)
-        seat_str = str(view_mode)
-        writhe_data = []
-        burau_data = []
+    # Extract plotted columns in a single pass (default view: Global)
+    count = len(data)
+    steps = np.empty(count, dtype=np.int64)
+    writhe_data = np.zeros(count, dtype=np.int64)
+    burau_data = np.zeros(count, dtype=np.float64)
+    actions = []
+    seat_str = str(view_mode)
+    
+    for i, item in enumerate(data):
+        steps[i] = item.get('step', 0)
+        actions.append(item.get('action', ''))
         
-        for _, row in df.iterrows():
-            players = row.get('players', {})
+        if view_mode == 0:
+            # Global view
+            global_metrics = item.get('global', {})
+            if not global_metrics:
+                # Backward compatibility: old format
+                writhe_data[i] = item.get('writhe', 0)
+                burau_data[i] = item.get('burau_trace_magnitude', 0.0)
+            else:
+                writhe_data[i] = global_metrics.get('writhe', 0)
+                burau_data[i] = global_metrics.get('burau', 0.0)
+        else:
+            # Seat view: players missing from an update stay at 0
+            players = item.get('players', {})
             if isinstance(players, dict) and seat_str in players:
                 player = players[seat_str]
-                writhe_data.append(player.get('writhe', 0))
-                burau_data.append(player.get('complexity', 0.0))
-            else:
-                writhe_data.append(0)
-                burau_data.append(0.0)
-        
-        writhe_data = pd.Series(writhe_data)
-        burau_data = pd.Series(burau_data)
+                writhe_data[i] = player.get('writhe', 0)
+                burau_data[i] = player.get('complexity', 0.0)
+    
+    # Sort by step (stable, so equal steps keep arrival order)
+    order = np.argsort(steps, kind='stable')
+    steps = steps[order]
+    writhe_data = writhe_data[order]
+    burau_data = burau_data[order]
+    actions = [actions[i] for i in order]
+    
+    # Setup plot
+    setup_plot()
     
     # Plot writhe as step function
-    ax1.step(df['step'], writhe_data, 
+    ax1.step(steps, writhe_data, 
              where='post', 
              color=WRITHE_COLOR, 
              linewidth=2.5,
@@ -435,7 +630,7 @@ def plot_static(data):
             ax1.set_ylim([writhe_min - 1, writhe_max + 1])
     
     # Plot burau magnitude as line
-    ax2.plot(df['step'], burau_data, 
+    ax2.plot(steps, burau_data, 
              color=BURAU_COLOR, 
              linewidth=2.5,
              label='Burau Trace Magnitude',
@@ -455,16 +650,19 @@ def plot_static(data):
     # Annotate actions on x-axis
     ylim = ax1.get_ylim()
     y_min = ylim[0]
-    
-    for idx, row in df.iterrows():
-        step = row['step']
-        action = row.get('action', '')
-        
+    y_text = y_min - (y_min * 0.1)
+    
+    # Each label is its own Artist: drop steps that repeat the action right
+    # before them in the full sequence, then thin the rest to MAX_ANNOTATIONS
+    labels = [(step, action) for i, (step, action) in enumerate(zip(steps, actions))
+              if i == 0 or action != actions[i - 1]]
+    stride = max(1, -(-len(labels) // MAX_ANNOTATIONS))
+    for step, action in labels[::stride]:
         # Truncate long action strings for readability
         action_short = action[:30] + '...' if len(action) > 30 else action
         
         # Rotate annotations 45 degrees
-        ax1.text(step, y_min - (y_min * 0.1), 
+        ax1.text(step, y_text, 
                  action_short, 
                  rotation=45, 
                  ha='left',
@@ -480,59 +678,7 @@ def plot_static(data):
         title_text.set_text(f'Braid Fingerprint Evolution (SEAT {view_mode})')
     
     # Update Player Roster HUD (use persistent registry, sorted by [S#] tag)
-    if player_registry:
-        # Build roster string sorted by [S#] tag
-        roster_lines = ['[G] GLOBAL VIEW', '']
-        
-        # Create list of (seat_number, seat_str, player_name) tuples
-        roster_entries = []
-        for seat_str, player_name in player_registry.items():
-            if not isinstance(player_name, str):
-                continue
-            
-            # Extract seat number from [S#] tag in name (search anywhere in string)
-            # Regex handles single digits (1-9) and double digits (10) correctly
-            seat_number = None
-            if '[S' in player_name:
-                # Robust regex: matches [S1], [S10], [S99], etc.
-                match = re.search(r'\[S(\d+)\]', player_name)
-                if match:
-                    seat_number = int(match.group(1))
-            
-            # If no tag found, skip this entry
-            if seat_number is None:
-                continue
-            
-            roster_entries.append((seat_number, seat_str, player_name))
-        
-        # Sort by seat number (from [S#] tag)
-        roster_entries.sort(key=lambda x: x[0])
-        
-        # Build roster entries with hotkey labels
-        for seat_number, seat_str, player_name in roster_entries:
-            # Determine hotkey label: [0] for Seat 10, [1-9] for Seats 1-9
-            if seat_number == 10:
-                label = '[0]'
-            elif 1 <= seat_number <= 9:
-                label = f'[{seat_number}]'
-            else:
-                label = '[?]'  # Fallback for unexpected seat numbers
-            
-            # Clean the name: Remove [S#] tag and @ ID part for display
-            # Format: "[S9] Barmom @ gmuSM0e3Nz" -> "Barmom"
-            clean_name = player_name
-            # Remove [S#] tag if present
-            clean_name = re.sub(r'\[S\d+\]\s*', '', clean_name)
-            # Remove @ ID part if present
-            if ' @ ' in clean_name:
-                clean_name = clean_name.split(' @ ')[0].strip()
-            
-            # Display format: [hotkey] CleanName (Seat N)
-            roster_lines.append(f'{label} {clean_name} (Seat {seat_number})')
-        
-        roster_text.set_text('\n'.join(roster_lines))
-    else:
-        roster_text.set_text('Waiting for players...')
+    roster_text.set_text(build_roster_text(player_registry))
     
     # Save plot
     output_file = 'braid_fingerprint.png'
@@ -563,19 +709,28 @@ def main():
         print(f"Starting live visualizer (WebSocket mode)", file=sys.stderr)
         print(f"Connecting to {args.ws}...", file=sys.stderr)
         
-        # Setup plot
-        setup_plot()
+        # Qt backend so the GUI and the WebSocket share one event loop (qasync);
+        # imported here so STDIN mode keeps working without a Qt install
+        import qasync
+        from matplotlib.backends.qt_compat import QtWidgets
+        plt.switch_backend('QtAgg')
         
-        # Start WebSocket thread
-        ws_thread = threading.Thread(target=websocket_thread, args=(args.ws,), daemon=True)
-        ws_thread.start()
+        # Setup plot (creates the QApplication)
+        setup_plot()
+        loop = qasync.QEventLoop(QtWidgets.QApplication.instance())
+        asyncio.set_event_loop(loop)
         
         # Start animation
-        ani = animation.FuncAnimation(fig, update_plot, interval=100, blit=False)
+        global ani
+        ani = animation.FuncAnimation(fig, update_plot, interval=FRAME_INTERVAL_MS, blit=True)
         
-        # Show plot (blocking)
+        # Show plot and run until the window is closed
+        plt.show(block=False)
+        fig.canvas.mpl_connect('close_event', lambda event: loop.stop())
+        loop.create_task(websocket_consumer(args.ws))
         try:
-            plt.show()
+            with loop:
+                loop.run_forever()
         except KeyboardInterrupt:
             print("\nVisualizer stopped by user", file=sys.stderr)
     else:
@@ -587,9 +742,9 @@ def main():
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = orjson.loads(line)
                 data.append(obj)
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 print(f"Warning: Skipping invalid JSON line: {e}", file=sys.stderr)
                 continue
         
@@ -12,29 +12,89 @@ Z: Complexity (Burau Magnitude)
 # 1. Force OpenGL import before PyQt to prevent driver conflicts on Windows
 import OpenGL.GL as gl 
 import sys
-import json
+import orjson
 import queue
 import threading
+import collections
 import asyncio
 import numpy as np
 from websockets import client as ws_client
 
 # GUI & 3D Imports
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QOpenGLWidget
+from PyQt5.QtCore import QTimer, Qt, QEvent
+from PyQt5.QtGui import QFont, QSurfaceFormat
 import pyqtgraph as pg
 import pyqtgraph.opengl as pgl  # Renamed to 'pgl' to avoid namespace collision
 
 # --- Configuration ---
 WS_URL = "ws://127.0.0.1:3030/ws"
 REFRESH_RATE_MS = 50
+MINIMIZED_REFRESH_RATE_MS = 500  # Inbox is still drained while minimized
+WS_MAX_SIZE = 2 ** 22  # 4 MiB per frame
+MAX_QUEUE_SIZE = 4096  # Pending messages per queue; oldest are dropped beyond this
+LOD_FULL_POINTS = 2048  # Most recent steps drawn at full resolution
+LOD_STRIDE = 8  # Older steps are drawn every Nth sample
+LOD_REBASE_STEPS = 512  # The full-resolution window advances in blocks (multiple of LOD_STRIDE)
+ANTIALIAS_MAX_POINTS = 500  # GL_LINE_SMOOTH gets slow on long traces; drop it above this
 SCALING_X = 1.0  # Time stretch
 SCALING_Y = 2.0  # Writhe height
 SCALING_Z = 2.0  # Burau depth
+NUM_SEATS = 10  # 0 = Global, 1-9 = Seats
+INITIAL_CAPACITY = 1024  # Steps per seat buffer; doubled on overflow
+_SEAT_KEYS = {str(i): i for i in range(1, NUM_SEATS)}  # Player seat keys as sent by the server
 
 # --- Global State ---
-data_queue = queue.Queue()
+# The WS thread queues raw frames for the parser thread, which appends parsed
+# messages; the GUI thread swaps the whole deque out under the lock once per frame.
+# Both are bounded so a stalled GUI can't grow memory without limit.
+_raw_inbox = queue.Queue(maxsize=MAX_QUEUE_SIZE)
+_inbox = collections.deque(maxlen=MAX_QUEUE_SIZE)
+_inbox_lock = threading.Lock()
+
+
+class IncrementalLineItem(pgl.GLLinePlotItem):
+    """
+    GLLinePlotItem that re-uploads only the changed tail of its vertex data.
+
+    setData() takes an extra `dirty_from` row index: rows before it are
+    promised unchanged since the previous call, so paint() patches the VBOs
+    from that row on instead of re-sending the whole array. VBOs grow by
+    doubling so appends rarely reallocate.
+    """
+
+    def __init__(self, **kwds):
+        self._dirty_from = None  # Lowest changed row pending upload (None = none)
+        super().__init__(**kwds)
+
+    def setData(self, dirty_from=0, **kwds):
+        if 'pos' in kwds or 'color' in kwds:
+            pending = self._dirty_from
+            self._dirty_from = dirty_from if pending is None else min(pending, dirty_from)
+        super().setData(**kwds)
+
+    def upload_vbo(self, vbo, arr):
+        # Only reached on pyqtgraph versions that manage VBOs via upload_vbo;
+        # older versions ignore dirty_from and upload everything as before.
+        if arr is None or len(arr) == 0:
+            super().upload_vbo(vbo, arr)
+            return
+        if not vbo.isCreated():
+            vbo.create()
+        vbo.bind()
+        if vbo.size() < arr.nbytes:
+            vbo.allocate(max(arr.nbytes, 2 * vbo.size()))
+            start = 0
+        else:
+            start = min(self._dirty_from or 0, len(arr))
+        offset = start * arr.itemsize * arr.shape[1]
+        if offset < arr.nbytes:
+            vbo.write(offset, arr[start:], arr.nbytes - offset)
+        vbo.release()
+
+    def paint(self):
+        super().paint()
+        self._dirty_from = None
 
 
 class BraidWindow(QMainWindow):
@@ -56,33 +116,46 @@ class BraidWindow(QMainWindow):
         self.hud_label.setStyleSheet("color: #00ff41; padding: 10px; background: rgba(0,0,0,0.8);")
         self.hud_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.hud_label)
+        self.last_hud_text = ""
 
         # 2. 3D Viewport
         self.view = pgl.GLViewWidget()
         self.view.setBackgroundColor(pg.mkColor(5, 5, 5)) # Deep black
         self.view.setCameraPosition(distance=40, elevation=30, azimuth=-90)
+        # GLViewWidget clears the frame itself in paintGL; skip Qt's extra clear
+        self.view.setUpdateBehavior(QOpenGLWidget.PartialUpdate)
         layout.addWidget(self.view)
 
         # 3D Objects
         self.init_3d_scene()
 
-        # Data Buffers: Per-Player Tracking
-        # Key 0 = Global, Keys 1-9 = Individual Seats
-        self.history_data = {}
-        for seat_id in range(10):  # 0-9 (0 = global, 1-9 = seats)
-            self.history_data[seat_id] = {
-                'w': [],  # writhe
-                'b': []   # burau
-            }
+        # Data Buffers: Per-Player Tracking (struct-of-arrays)
+        # Row 0 = Global, Rows 1-9 = Individual Seats; self.n[seat] = valid length
+        # Samples are narrowed to float32 as they are written, so the render
+        # path works on float32 end to end with no astype copies.
+        self.capacity = INITIAL_CAPACITY
+        self.w_buf = np.empty((NUM_SEATS, self.capacity), dtype=np.float32)  # writhe
+        self.b_buf = np.empty((NUM_SEATS, self.capacity), dtype=np.float32)  # burau
+        self.n = [0] * NUM_SEATS
+        # X coordinate of every step index, materialized once
+        self.x_axis = np.arange(self.capacity, dtype=np.float32) * SCALING_X
+        # Seats whose buffers changed since their trace was last drawn
+        self.dirty = [False] * NUM_SEATS
+
+        # Scratch vertex/color buffers, filled in place by redraw_trace
+        self.pos_scratch = np.empty((self.capacity, 3), dtype=np.float32, order='C')
+        self.colors_buf = self.new_colors_buf(self.capacity)
+        # Layout of the vertices currently in the scratch buffers
+        self.trace_seat = None  # None = nothing reusable
+        self.trace_split = 0
+        self.trace_rows = 0
         
         # Player names cache (seat_id -> name)
         self.player_names = {}
         
         # View Mode: 0 = Global, 1-9 = Seat ID
         self.current_view_mode = 0
-        
-        # Initialize empty arrays with correct types for OpenGL
-        self.pos_array = np.zeros((0, 3), dtype=np.float32)
+
 
         # Animation Loop
         self.timer = QTimer()
@@ -99,7 +172,7 @@ class BraidWindow(QMainWindow):
 
         # The Trajectory Line (The "Knot")
         # Initialize with dummy float32 data to set types correctly immediately
-        self.line_item = pgl.GLLinePlotItem(
+        self.line_item = IncrementalLineItem(
             pos=np.array([[0,0,0], [0,0,0]], dtype=np.float32), 
             color=pg.mkColor(0, 255, 255, 255), 
             width=3.0, 
@@ -107,7 +180,7 @@ class BraidWindow(QMainWindow):
         )
         self.view.addItem(self.line_item)
 
-        # The Head (Current State Marker)
+        # The Head (Current State Marker); color is fixed, redraw_trace only moves it
         self.head_marker = pgl.GLScatterPlotItem(
             pos=np.array([[0,0,0]], dtype=np.float32), 
             color=[1.0, 0.0, 1.0, 1.0], 
@@ -125,92 +198,167 @@ class BraidWindow(QMainWindow):
         self.view.addItem(zero_line)
 
     def update_loop(self):
-        """Consume queue and update 3D geometry"""
-        updated = False
-        
-        while not data_queue.empty():
+        """Consume inbox and update 3D geometry"""
+        global _inbox
+
+        with _inbox_lock:
+            batch, _inbox = _inbox, collections.deque(maxlen=MAX_QUEUE_SIZE)
+
+        latest = None  # (action, step) of the last message applied
+        for data in batch:
             try:
-                data = data_queue.get_nowait()
                 if data is None: continue
                 
                 step = data['step']
                 action = data['action']
                 
-                # Extract global metrics
-                global_metrics = data.get('global', {})
-                global_writhe = global_metrics.get('writhe', 0)
-                global_burau = global_metrics.get('burau', 0.0)
-                
-                # Extract player metrics
-                players = data.get('players', {})
+                # Extract global and player metrics. The server always sends
+                # the full schema, so subscript directly; defaults only on miss.
+                try:
+                    global_metrics = data['global']
+                    global_writhe = global_metrics['writhe']
+                    global_burau = global_metrics['burau']
+                    players = data['players']
+                except (KeyError, TypeError):
+                    global_metrics = data.get('global') or {}
+                    global_writhe = global_metrics.get('writhe', 0)
+                    global_burau = global_metrics.get('burau', 0.0)
+                    players = data.get('players') or {}
                 
                 # Detect Hand Reset (Step count drops)
-                if len(self.history_data[0]['w']) > 0 and step < len(self.history_data[0]['w']):
+                if self.n[0] > 0 and step < self.n[0]:
                     self.reset_trace()
 
                 # Update Global (seat_id = 0)
-                self.history_data[0]['w'].append(global_writhe)
-                self.history_data[0]['b'].append(global_burau)
+                self.append_sample(0, global_writhe, global_burau)
                 
                 # Update Per-Player metrics
                 for seat_str, player_data in players.items():
-                    try:
-                        seat_id = int(seat_str)
-                        if 1 <= seat_id <= 9:
-                            # Store player name
-                            if 'name' in player_data:
-                                self.player_names[seat_id] = player_data['name']
-                            
-                            # Ensure lists are long enough (pad with last value if needed)
-                            while len(self.history_data[seat_id]['w']) < len(self.history_data[0]['w']) - 1:
-                                last_w = self.history_data[seat_id]['w'][-1] if self.history_data[seat_id]['w'] else 0
-                                last_b = self.history_data[seat_id]['b'][-1] if self.history_data[seat_id]['b'] else 0.0
-                                self.history_data[seat_id]['w'].append(last_w)
-                                self.history_data[seat_id]['b'].append(last_b)
-                            
-                            self.history_data[seat_id]['w'].append(player_data.get('writhe', 0))
-                            self.history_data[seat_id]['b'].append(player_data.get('complexity', 0.0))
-                    except (ValueError, KeyError):
+                    seat_id = _SEAT_KEYS.get(seat_str)
+                    if seat_id is None:
                         continue
+                    # Store player name
+                    if 'name' in player_data:
+                        self.player_names[seat_id] = player_data['name']
+                    
+                    # Ensure buffers are long enough (pad with last value if needed)
+                    self.pad_seat(seat_id, self.n[0] - 1)
+                    
+                    try:
+                        writhe = player_data['writhe']
+                        complexity = player_data['complexity']
+                    except KeyError:
+                        writhe = player_data.get('writhe', 0)
+                        complexity = player_data.get('complexity', 0.0)
+                    self.append_sample(seat_id, writhe, complexity)
                 
-                # Update HUD with current view mode
-                self.update_hud(action, step)
-                updated = True
-            except (queue.Empty, KeyError):
-                break
+                latest = (action, step)
+            except KeyError:
+                continue
+
+        # Update HUD with current view mode, once per batch
+        if latest is not None:
+            self.update_hud(*latest)
 
-        if updated:
+        # Only re-upload geometry when the watched seat actually changed.
+        # While minimized, keep the dirty flag and draw once restored.
+        if self.isMinimized():
+            return
+        if self.dirty[self.current_view_mode]:
+            self.dirty[self.current_view_mode] = False
             self.redraw_trace()
+
+    def append_sample(self, seat_id, writhe, burau):
+        """Append one (writhe, burau) sample to a seat's buffers"""
+        n = self.n[seat_id]
+        if n == self.capacity:
+            self.grow_buffers()
+        self.w_buf[seat_id, n] = writhe
+        self.b_buf[seat_id, n] = burau
+        self.n[seat_id] = n + 1
+        self.dirty[seat_id] = True
+
+    def pad_seat(self, seat_id, length):
+        """Extend a seat's buffers to `length` by repeating its last sample"""
+        k = self.n[seat_id]
+        if k >= length:
+            return
+        while length > self.capacity:
+            self.grow_buffers()
+        self.w_buf[seat_id, k:length].fill(self.w_buf[seat_id, k - 1] if k else 0.0)
+        self.b_buf[seat_id, k:length].fill(self.b_buf[seat_id, k - 1] if k else 0.0)
+        self.n[seat_id] = length
+        self.dirty[seat_id] = True
+
+    def grow_buffers(self):
+        """Double buffer capacity, keeping existing samples"""
+        old = self.capacity
+        self.capacity = old * 2
+        for name in ('w_buf', 'b_buf'):
+            grown = np.empty((NUM_SEATS, self.capacity), dtype=np.float32)
+            grown[:, :old] = getattr(self, name)
+            setattr(self, name, grown)
+        self.x_axis = np.arange(self.capacity, dtype=np.float32) * SCALING_X
+        # Keep already-built vertices so the next redraw stays incremental
+        pos_scratch = np.empty((self.capacity, 3), dtype=np.float32, order='C')
+        pos_scratch[:old] = self.pos_scratch
+        self.pos_scratch = pos_scratch
+        colors_buf = self.new_colors_buf(self.capacity)
+        colors_buf[:old, 1] = self.colors_buf[:, 1]
+        self.colors_buf = colors_buf
+
+    @staticmethod
+    def new_colors_buf(capacity):
+        """Color buffer with the constant R/B/A channels prefilled"""
+        colors = np.empty((capacity, 4), dtype=np.float32, order='C')
+        colors[:, 0] = 0.0  # R
+        colors[:, 2] = 1.0  # B
+        colors[:, 3] = 1.0  # Alpha
+        return colors
     
     def update_hud(self, action: str, step: int):
         """Update HUD label based on current view mode"""
         if self.current_view_mode == 0:
             # Global view
-            w = self.history_data[0]['w'][-1] if self.history_data[0]['w'] else 0
-            b = self.history_data[0]['b'][-1] if self.history_data[0]['b'] else 0.0
-            self.hud_label.setText(f"WATCHING: GLOBAL\nLIVE: {action}\n[Writhe: {w} | Burau: {b:.2f}]")
+            n = self.n[0]
+            w = int(self.w_buf[0, n - 1]) if n else 0
+            b = self.b_buf[0, n - 1] if n else 0.0
+            text = f"WATCHING: GLOBAL\nLIVE: {action}\n[Writhe: {w} | Burau: {b:.2f}]"
         else:
             # Player view
             seat_id = self.current_view_mode
             player_name = self.player_names.get(seat_id, f"Seat {seat_id}")
-            if seat_id in self.history_data and self.history_data[seat_id]['w']:
-                w = self.history_data[seat_id]['w'][-1]
-                b = self.history_data[seat_id]['b'][-1]
-                self.hud_label.setText(f"WATCHING: SEAT {seat_id} ({player_name})\nLIVE: {action}\n[Writhe: {w} | Complexity: {b:.2f}]")
+            n = self.n[seat_id]
+            if n:
+                w = int(self.w_buf[seat_id, n - 1])
+                b = self.b_buf[seat_id, n - 1]
+                text = f"WATCHING: SEAT {seat_id} ({player_name})\nLIVE: {action}\n[Writhe: {w} | Complexity: {b:.2f}]"
             else:
-                self.hud_label.setText(f"WATCHING: SEAT {seat_id} ({player_name})\nLIVE: {action}\n[No data yet]")
+                text = f"WATCHING: SEAT {seat_id} ({player_name})\nLIVE: {action}\n[No data yet]"
+
+        # setText relayouts the label even for identical text; skip it
+        if text != self.last_hud_text:
+            self.hud_label.setText(text)
+            self.last_hud_text = text
 
     def reset_trace(self):
         """Clear the 3D line for a new hand"""
-        for seat_id in range(10):
-            self.history_data[seat_id]['w'] = []
-            self.history_data[seat_id]['b'] = []
+        self.n = [0] * NUM_SEATS
+        self.trace_seat = None
         # Note: Don't clear player_names, as they persist across hands
-        # Clear with empty float32 array
-        self.pos_array = np.zeros((0, 3), dtype=np.float32)
-        self.line_item.setData(pos=self.pos_array)
+        # Buffers are kept for the next hand; clear the line with an empty view
+        self.line_item.setData(pos=self.pos_scratch[:0])
         print("--- HAND RESET ---")
 
+    def changeEvent(self, event):
+        """Throttle the update timer while the window is minimized"""
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.timer.setInterval(MINIMIZED_REFRESH_RATE_MS)
+            else:
+                self.timer.setInterval(REFRESH_RATE_MS)
+        super().changeEvent(event)
+
     def keyPressEvent(self, event):
         """Handle hotkey presses to switch view modes"""
         key = event.key()
@@ -218,7 +366,8 @@ class BraidWindow(QMainWindow):
         if key >= Qt.Key_0 and key <= Qt.Key_9:
             seat_id = key - Qt.Key_0
             self.current_view_mode = seat_id
-            self.redraw_trace()
+            # Redrawn on the next timer tick
+            self.dirty[seat_id] = True
             # Update title and HUD
             if seat_id == 0:
                 self.setWindowTitle("Braid Engine: Topological Phase Space (GLOBAL)")
@@ -226,67 +375,98 @@ class BraidWindow(QMainWindow):
                 player_name = self.player_names.get(seat_id, f"Seat {seat_id}")
                 self.setWindowTitle(f"Braid Engine: Topological Phase Space (SEAT {seat_id}: {player_name})")
             # Refresh HUD to show updated view mode
-            if self.history_data[0]['w']:
+            if self.n[0]:
                 action = "Current View"
-                self.update_hud(action, len(self.history_data[0]['w']))
+                self.update_hud(action, self.n[0])
         super().keyPressEvent(event)
     
     def redraw_trace(self):
         # Get data for current view mode
-        view_data = self.history_data.get(self.current_view_mode, {'w': [], 'b': []})
-        writhe_list = view_data['w']
-        burau_list = view_data['b']
+        seat_id = self.current_view_mode
+        n = self.n[seat_id]
         
-        if not writhe_list or not burau_list:
+        if n == 0:
             return
 
-        # Prepare 3D Coordinates
-        # X = Time (step index), Y = Writhe, Z = Burau
-        steps = np.arange(len(writhe_list))
-        x = steps * SCALING_X
-        y = np.array(writhe_list) * SCALING_Y
-        z = np.array(burau_list) * SCALING_Z
+        # Level of detail: recent steps are drawn at full resolution, older
+        # history every LOD_STRIDE-th step so the vertex count stays bounded.
+        # The split only moves in LOD_REBASE_STEPS blocks, so between moves
+        # the vertex list is append-only.
+        if n > LOD_FULL_POINTS:
+            split = (n - LOD_FULL_POINTS) // LOD_REBASE_STEPS * LOD_REBASE_STEPS
+        else:
+            split = 0
+        strided = split // LOD_STRIDE  # Rows before the full-resolution part
+        m = strided + n - split
+
+        # Rows already built for this seat and layout are reused
+        if seat_id != self.trace_seat:
+            start = 0
+        elif split != self.trace_split:
+            start = self.trace_split // LOD_STRIDE
+        else:
+            start = min(self.trace_rows, m)
+        self.trace_seat, self.trace_split, self.trace_rows = seat_id, split, m
 
-        # Center X around the current head to keep camera focused
-        center_x = x[-1]
-        x_centered = x - center_x
+        # Prepare 3D Coordinates for rows [start, m) in the scratch buffer
+        # X = Time (step index), Y = Writhe, Z = Burau
+        pos = self.pos_scratch
+        if start < strided:
+            src = slice(start * LOD_STRIDE, split, LOD_STRIDE)
+            pos[start:strided, 0] = self.x_axis[src]
+            np.multiply(self.w_buf[seat_id, src], SCALING_Y, out=pos[start:strided, 1])
+            np.multiply(self.b_buf[seat_id, src], SCALING_Z, out=pos[start:strided, 2])
+        lo = max(start, strided)
+        src = slice(split + lo - strided, n)
+        pos[lo:m, 0] = self.x_axis[src]
+        np.multiply(self.w_buf[seat_id, src], SCALING_Y, out=pos[lo:m, 1])
+        np.multiply(self.b_buf[seat_id, src], SCALING_Z, out=pos[lo:m, 2])
 
         # CRITICAL FIX FOR WINDOWS OPENGL:
-        # 1. Cast to float32
-        # 2. Force memory to be contiguous (C-style) using ascontiguousarray
-        pos_data = np.column_stack((x_centered, y, z)).astype(np.float32)
-        self.pos_array = np.ascontiguousarray(pos_data)
+        # Vertex data must be float32 and C-contiguous. The scratch buffers are
+        # allocated that way, and leading-row slices of them stay contiguous,
+        # so no per-frame ascontiguousarray copy is needed.
 
         # Dynamic Coloring based on Burau (Complexity)
         # Low = Green, High = Cyan/Pink
-        colors = np.zeros((len(z), 4), dtype=np.float32)
-        
-        # Vectorized color calculation for speed
+        # R/B/A are constant in colors_buf; only G is rewritten, in place.
         # Normalize roughly based on max expected burau (e.g. 24.0)
-        intensity = np.clip(z / 24.0, 0.0, 1.0).astype(np.float32)
+        g = self.colors_buf[start:m, 1]
+        np.multiply(pos[start:m, 2], 1.0 / 24.0, out=g)
+        np.clip(g, 0.0, 1.0, out=g)
+        np.subtract(1.0, g, out=g)  # Fade out green as complexity rises
+
+        # Update Geometry; only rows from `start` on are re-uploaded
+        self.line_item.setData(pos=pos[:m], color=self.colors_buf[:m], dirty_from=start,
+                               antialias=m < ANTIALIAS_MAX_POINTS)
         
-        colors[:, 0] = 0.0              # R
-        colors[:, 1] = 1.0 - intensity  # G (Fade out green as complexity rises)
-        colors[:, 2] = 1.0              # B
-        colors[:, 3] = 1.0              # Alpha
+        # Update Head: (1, 3) contiguous view of the last vertex
+        self.head_marker.setData(pos=pos[m - 1:m])
 
-        # Force contiguous memory for colors too
-        colors_contiguous = np.ascontiguousarray(colors)
+        # Center X around the current head to keep camera focused. Done in the
+        # item transforms so vertex data doesn't shift every frame.
+        center_x = float(self.x_axis[n - 1])
+        for item in (self.line_item, self.head_marker):
+            item.resetTransform()
+            item.translate(-center_x, 0, 0)
 
-        # Update Geometry
-        self.line_item.setData(pos=self.pos_array, color=colors_contiguous)
-        
-        # Update Head
-        if len(self.pos_array) > 0:
-            last_pos = self.pos_array[-1]
-            # Reshape for scatter plot (1, 3)
-            head_pos = np.ascontiguousarray(last_pos.reshape(1, 3))
-            self.head_marker.setData(pos=head_pos, color=[1.0, 0.0, 1.0, 1.0])
+
+def configure_gl_format():
+    """Default GL surface: vsync-aligned swaps, no multisampling"""
+    fmt = QSurfaceFormat.defaultFormat()
+    fmt.setSwapInterval(1)
+    fmt.setSamples(0)
+    QSurfaceFormat.setDefaultFormat(fmt)
 
 
 # --- WebSocket Threading ---
 def start_websocket_thread():
-    loop = asyncio.new_event_loop()
+    # Prefer uvloop's libuv-based loop for faster socket reads (not available on Windows)
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     loop.run_until_complete(ws_listen())
 
@@ -294,22 +474,48 @@ def start_websocket_thread():
 async def ws_listen():
     while True:
         try:
-            async with ws_client.connect(WS_URL, ping_interval=None) as websocket:
+            # The server doesn't negotiate permessage-deflate; skip the extension
+            async with ws_client.connect(WS_URL, ping_interval=None, max_size=WS_MAX_SIZE,
+                                         compression=None) as websocket:
                 print("Connected to Braid Engine.")
                 async for message in websocket:
-                    data_queue.put(json.loads(message))
+                    try:
+                        _raw_inbox.put_nowait(message)
+                    except queue.Full:
+                        # Parser is behind: drop the oldest frame
+                        try:
+                            _raw_inbox.get_nowait()
+                        except queue.Empty:
+                            pass
+                        _raw_inbox.put_nowait(message)
         except Exception as e:
             print(f"Connection error: {e}. Retrying in 2s...")
             await asyncio.sleep(2)
 
 
+def parse_messages():
+    """Parser thread: decode raw frames off the WS event loop"""
+    while True:
+        message = _raw_inbox.get()
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError as e:
+            print(f"Dropping malformed message: {e}")
+            continue
+        with _inbox_lock:
+            _inbox.append(data)  # Evicts the oldest message when full
+
+
 # --- Main Entry Point ---
 if __name__ == "__main__":
     # 1. Start WebSocket Consumer in Background
     ws_thread = threading.Thread(target=start_websocket_thread, daemon=True)
     ws_thread.start()
+    parser_thread = threading.Thread(target=parse_messages, daemon=True)
+    parser_thread.start()
 
-    # 2. Start GUI
+    # 2. Start GUI (the default GL format must be set before the QApplication)
+    configure_gl_format()
     app = QApplication(sys.argv)
     window = BraidWindow()
     window.show()
@@ -3,7 +3,7 @@ use futures::{SinkExt, StreamExt};
 use poker_parser::{pokernow, SeatResolver};
 use std::sync::Arc;
 use std::collections::HashMap;
-use tokio::sync::{broadcast, RwLock};
+use tokio::sync::{broadcast, mpsc, RwLock};
 use warp::Filter;
 
 /// Shared state for the server
@@ -221,26 +221,78 @@ pub async fn handle_action(
     ))
 }
 
+/// Parses and applies one WebSocket action frame (an `ActionRequest` JSON body)
+async fn apply_ws_action(text: &str, state: &SharedState) -> Result<FingerprintResponse, String> {
+    let req: ActionRequest = serde_json::from_str(text).map_err(|e| e.to_string())?;
+
+    let mut state_guard = state.write().await;
+    let action = parse_action_string(&req.action_string, &mut *state_guard).map_err(|e| e.to_string())?;
+    process_action(action, &mut *state_guard).map_err(|e| e.to_string())
+}
+
 /// WebSocket connection handler
+///
+/// Outbound: every fingerprint update is broadcast to the client as-is.
+/// Inbound: text frames carrying an `ActionRequest` JSON body are processed
+/// exactly like POST /action, so clients can pipeline many actions over one
+/// connection instead of paying a round-trip per action. Each action frame
+/// gets exactly one direct reply on the same socket, in order:
+/// `{"reply": <update>}` on success or `{"error": "..."}` on failure.
+/// Successful updates are also broadcast to every client as usual.
 pub async fn handle_ws(
     ws: warp::ws::WebSocket,
+    state: SharedState,
     tx: broadcast::Sender<FingerprintResponse>,
 ) {
-    let (mut ws_tx, _ws_rx) = ws.split();
+    let (mut ws_tx, mut ws_rx) = ws.split();
     let mut rx = tx.subscribe();
+    let (reply_tx, mut reply_rx) = mpsc::unbounded_channel::<String>();
 
-    // Send initial state
+    // Single writer for this socket: broadcasts plus direct replies
     tokio::spawn(async move {
-        while let Ok(msg) = rx.recv().await {
-            let json = match serde_json::to_string(&msg) {
-                Ok(j) => j,
-                Err(_) => continue,
+        loop {
+            let json = tokio::select! {
+                msg = rx.recv() => match msg {
+                    Ok(m) => match serde_json::to_string(&m) {
+                        Ok(j) => j,
+                        Err(_) => continue,
+                    },
+                    Err(broadcast::error::RecvError::Lagged(_)) => continue,
+                    Err(broadcast::error::RecvError::Closed) => break,
+                },
+                reply = reply_rx.recv() => match reply {
+                    Some(j) => j,
+                    None => break,
+                },
             };
             if ws_tx.send(warp::ws::Message::text(json)).await.is_err() {
                 break;
             }
         }
     });
+
+    // Process inbound actions in arrival order
+    while let Some(Ok(msg)) = ws_rx.next().await {
+        let text = match msg.to_str() {
+            Ok(t) => t,
+            Err(_) => continue, // Ignore ping/pong/binary frames
+        };
+
+        let reply = match apply_ws_action(text, &state).await {
+            Ok(response) => {
+                // Broadcast to WebSocket clients (including this one)
+                let _ = tx.send(response.clone());
+                serde_json::json!({"reply": response})
+            }
+            Err(e) => {
+                eprintln!("WebSocket action failed: {}", e);
+                serde_json::json!({"error": e})
+            }
+        };
+        if reply_tx.send(reply.to_string()).is_err() {
+            break; // Writer is gone: the socket closed
+        }
+    }
 }
 
 /// Creates the server routes
@@ -262,9 +314,10 @@ pub fn create_routes(
     // GET /ws
     let ws_route = warp::path("ws")
         .and(warp::ws())
+        .and(state_filter)
         .and(tx_filter)
-        .map(|ws: warp::ws::Ws, tx| {
-            ws.on_upgrade(move |socket| handle_ws(socket, tx))
+        .map(|ws: warp::ws::Ws, state, tx| {
+            ws.on_upgrade(move |socket| handle_ws(socket, state, tx))
         });
 
     // CORS headers
@@ -302,3 +355,87 @@ pub async fn start_server(reset_on_fold: bool) -> Result<(), Box<dyn std::error:
     Ok(())
 }
 
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::Value;
+    use std::time::Duration;
+    use warp::test::WsClient;
+
+    fn action_frame(action: &str) -> String {
+        serde_json::json!({ "action_string": action }).to_string()
+    }
+
+    /// Next frame as JSON; fails instead of hanging if nothing arrives
+    async fn recv_json(client: &mut WsClient) -> Value {
+        let msg = tokio::time::timeout(Duration::from_secs(5), client.recv())
+            .await
+            .expect("timed out waiting for a frame")
+            .expect("websocket closed");
+        serde_json::from_str(msg.to_str().expect("text frame")).expect("frame is JSON")
+    }
+
+    /// Next direct reply (`reply` or `error`), skipping plain broadcasts
+    async fn recv_reply(client: &mut WsClient) -> Value {
+        loop {
+            let frame = recv_json(client).await;
+            if frame.get("reply").is_some() || frame.get("error").is_some() {
+                return frame;
+            }
+        }
+    }
+
+    #[tokio::test]
+    async fn test_ws_actions_reply_in_order_and_broadcast() {
+        let state: SharedState = Arc::new(RwLock::new(ServerState::new(false)));
+        let (tx, _rx) = broadcast::channel::<FingerprintResponse>(100);
+        let routes = create_routes(state, tx);
+
+        let mut watcher = warp::test::ws()
+            .path("/ws")
+            .handshake(routes.clone())
+            .await
+            .expect("watcher handshake");
+        let mut sender = warp::test::ws()
+            .path("/ws")
+            .handshake(routes)
+            .await
+            .expect("sender handshake");
+
+        // A round-trip proves the watcher's handler is running (and so
+        // subscribed to broadcasts) before the sender's batch goes out
+        watcher.send_text(action_frame("not an action")).await;
+        assert!(recv_reply(&mut watcher).await.get("error").is_some());
+
+        let actions = [
+            "-- starting hand #1 --",
+            "Alice @ p1 bets 10",
+            "Bob @ p2 calls 10",
+            "Alice @ p1 raises to 20",
+        ];
+        for action in &actions {
+            sender.send_text(action_frame(action)).await;
+        }
+
+        // One reply per frame, in order (the reset is step 0)
+        for expected_step in 0..actions.len() {
+            let frame = recv_reply(&mut sender).await;
+            assert!(frame.get("error").is_none(), "unexpected error: {}", frame);
+            assert_eq!(frame["reply"]["step"].as_u64(), Some(expected_step as u64));
+        }
+
+        // Unparseable frames get an error reply and leave the socket usable
+        sender.send_text("{not json").await;
+        assert!(recv_reply(&mut sender).await.get("error").is_some());
+        sender.send_text(action_frame("not an action")).await;
+        assert!(recv_reply(&mut sender).await.get("error").is_some());
+
+        // The other client still sees every update as a plain broadcast
+        for expected_step in 0..actions.len() {
+            let frame = recv_json(&mut watcher).await;
+            assert!(frame.get("reply").is_none());
+            assert_eq!(frame["step"].as_u64(), Some(expected_step as u64));
+        }
+    }
+}